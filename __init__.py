@@ -1,19 +1,32 @@
 """The Nature Remo integration."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
-from datetime import timedelta
+import random
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any
 
-import async_timeout
+import aiohttp
+import orjson
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.util.read_only_dict import ReadOnlyDict
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
 
 from .const import (
     DOMAIN,
@@ -24,14 +37,71 @@ from .const import (
     DEFAULT_HEAT_TEMP,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_TIMEOUT,
+    DEFAULT_AC_DEBOUNCE,
     API_ENDPOINT,
+    API_DEVICES,
+    API_APPLIANCES,
     ERROR_AUTH,
     ERROR_CONNECTION,
     ERROR_TIMEOUT,
+    ERROR_RESPONSE,
+    FW_TO_MODEL_NAME,
+    MANUFACTURER,
+    MODEL_UNKNOWN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Devices that have not reported to the cloud for this long are unavailable.
+DEVICE_AVAILABILITY_WINDOW = 3600  # seconds
+
+# Availability can flip purely by time passing (a device going quiet while
+# the polled payload stays identical), which no coordinator dispatch will
+# ever announce; entities re-check it on this cadence.
+AVAILABILITY_CHECK_INTERVAL = timedelta(seconds=60)
+
+# One request-level timeout object, reused for every API call.
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
+
+
+class NatureRemoError(Exception):
+    """Base error raised for Nature Remo API failures."""
+
+
+class NatureRemoAuthError(NatureRemoError):
+    """The access token was rejected by the API."""
+
+
+class NatureRemoConnectionError(NatureRemoError):
+    """The API could not be reached in time."""
+
+
+@lru_cache(maxsize=64)
+def _encode_settings(items: tuple[tuple[str, Any], ...]) -> dict[str, str]:
+    """Stringify an AC settings payload, cached per distinct combination.
+
+    Users cycle through a handful of mode/temperature combinations, so the
+    same payload is re-encoded constantly on the control path.
+    """
+    return {key: str(value) for key, value in items}
+
+
+@lru_cache(maxsize=128)
+def _updated_epoch(updated_at: str) -> float | None:
+    """Return a device's updated_at as epoch seconds, memoized per string.
+
+    The same timestamp string is read by every entity sharing a device and
+    re-read on every poll where it is unchanged; reducing it to epoch
+    seconds once lets the availability check become a float subtraction
+    with no datetime or timezone arithmetic. Python 3.11+ fromisoformat
+    accepts the trailing "Z" directly.
+    """
+    try:
+        return datetime.fromisoformat(updated_at).timestamp()
+    except ValueError:
+        return None
+
+
 PLATFORMS = [
     Platform.CLIMATE,
     Platform.SENSOR,
@@ -40,18 +110,36 @@ PLATFORMS = [
     Platform.MEDIA_PLAYER,
 ]
 
-CONFIG_SCHEMA = vol.Schema(
-    {
-        DOMAIN: vol.Schema(
-            {
-                vol.Required(CONF_ACCESS_TOKEN): cv.string,
-                vol.Optional(CONF_COOL_TEMP, default=DEFAULT_COOL_TEMP): vol.Coerce(int),
-                vol.Optional(CONF_HEAT_TEMP, default=DEFAULT_HEAT_TEMP): vol.Coerce(int),
-            }
+def _validate_config(config: dict) -> dict:
+    """Validate legacy YAML configuration without the voluptuous runtime.
+
+    Config entries are the primary path now and YAML is a one-shot import,
+    so paying vol.Schema dispatch on every startup isn't warranted. The
+    handwritten coercions match the old schema exactly, and failures raise
+    vol.Invalid because that is the only exception HA reports as a config
+    error instead of a traceback.
+    """
+    if DOMAIN not in config:
+        return config
+    conf = config[DOMAIN]
+    if not isinstance(conf, dict):
+        raise vol.Invalid(f"expected a dictionary for {DOMAIN}")
+    if CONF_ACCESS_TOKEN not in conf:
+        raise vol.Invalid(
+            f"required key not provided @ data['{DOMAIN}']['{CONF_ACCESS_TOKEN}']"
         )
-    },
-    extra=vol.ALLOW_EXTRA,
-)
+    try:
+        config[DOMAIN] = {
+            CONF_ACCESS_TOKEN: str(conf[CONF_ACCESS_TOKEN]),
+            CONF_COOL_TEMP: int(conf.get(CONF_COOL_TEMP, DEFAULT_COOL_TEMP)),
+            CONF_HEAT_TEMP: int(conf.get(CONF_HEAT_TEMP, DEFAULT_HEAT_TEMP)),
+        }
+    except (TypeError, ValueError) as err:
+        raise vol.Invalid(f"invalid {DOMAIN} configuration: {err}") from err
+    return config
+
+
+CONFIG_SCHEMA = _validate_config
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up Nature Remo component."""
@@ -73,39 +161,67 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Nature Remo from a config entry."""
-    session = async_get_clientsession(hass)
-    
-    api = NatureRemoAPI(
-        entry.data[CONF_ACCESS_TOKEN],
-        session,
-        API_ENDPOINT
-    )
+    hass.data.setdefault(DOMAIN, {})
+    shared_apis = hass.data[DOMAIN].setdefault("_apis", {})
+
+    token = entry.data[CONF_ACCESS_TOKEN]
+    token_key = hashlib.sha256(token.encode()).hexdigest()
+    shared = shared_apis.get(token_key)
+
+    if shared is None:
+        # Only the client (session, ETag cache, write debouncer) is shared
+        # per token. Each entry runs its own coordinator so HA manages the
+        # coordinator's lifecycle with the entry that created it; extra
+        # coordinators on one token are cheap because their fetches are
+        # conditional GETs served from the shared ETag cache.
+        shared = {"api": NatureRemoAPI(token, base_url=API_ENDPOINT), "refs": 0}
+        shared_apis[token_key] = shared
+    api = shared["api"]
 
     async def async_update_data():
         """Fetch data from API with error handling and rate limiting."""
         try:
-            async with async_timeout.timeout(DEFAULT_TIMEOUT):
-                data = await api.get_all_data()
-                return data
-        except Exception as err:
+            return await api.get_all_data()
+        except NatureRemoAuthError:
+            raise
+        except (NatureRemoError, asyncio.TimeoutError) as err:
             _LOGGER.error("Error communicating with API: %s", err)
-            raise ConfigEntryNotReady from err
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+    # Jitter the interval by up to 10% so multiple entries (and other
+    # integrations on the same default cadence) don't all poll at the
+    # same wall-clock instant and trip rate limiting.
+    jitter = random.uniform(0, DEFAULT_UPDATE_INTERVAL.total_seconds() * 0.1)
 
-    coordinator = DataUpdateCoordinator(
+    coordinator = NatureRemoCoordinator(
         hass,
         _LOGGER,
         name=f"{DOMAIN}_coordinator",
         update_method=async_update_data,
-        update_interval=DEFAULT_UPDATE_INTERVAL,
+        update_interval=DEFAULT_UPDATE_INTERVAL + timedelta(seconds=jitter),
+        always_update=False,
     )
 
-    # Initial data fetch
-    await coordinator.async_config_entry_first_refresh()
+    # Initial data fetch. If it fails (ConfigEntryNotReady while the cloud
+    # is down), release the owned session before the setup retry loop
+    # constructs a fresh client, or every retry would leak one.
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        if shared["refs"] == 0:
+            del shared_apis[token_key]
+            await api.close_session()
+        raise
+
+    shared["refs"] += 1
+
+    await _async_register_devices(hass, entry, coordinator.data)
 
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
         "api": api,
         "config": entry.data,
+        "token_key": token_key,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -113,11 +229,489 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_register_devices(
+    hass: HomeAssistant, entry: ConfigEntry, data: dict[str, Any]
+) -> None:
+    """Register devices, skipping ones already present in the registry.
+
+    async_get_or_create walks the registry to dedupe by identifiers, so
+    calling it unconditionally for every device is O(N^2) at startup.
+    Checking against the set of already-registered identifiers first makes
+    the common restart path a set lookup per device, and control is yielded
+    periodically so a large first-time registration doesn't starve the
+    event loop.
+    """
+    registry = dr.async_get(hass)
+    existing = {
+        identifier
+        for device in dr.async_entries_for_config_entry(registry, entry.entry_id)
+        for identifier in device.identifiers
+    }
+    registered = 0
+    for device_id, info in data["device_info"].items():
+        if (DOMAIN, device_id) in existing:
+            continue
+        registry.async_get_or_create(config_entry_id=entry.entry_id, **info)
+        registered += 1
+        if registered % 20 == 0:
+            await asyncio.sleep(0)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        shared_apis = hass.data[DOMAIN].get("_apis", {})
+        shared = shared_apis.get(entry_data["token_key"])
+        if shared is not None:
+            shared["refs"] -= 1
+            if shared["refs"] <= 0:
+                del shared_apis[entry_data["token_key"]]
+                await shared["api"].close_session()
 
     return unload_ok
+
+
+def _merge_entries(target: dict[str, dict], fresh: list[dict]) -> None:
+    """Merge a fresh API listing into a persistent id-keyed map.
+
+    Unchanged entries keep their existing dict object so most of the payload
+    isn't reallocated on every poll; only entries whose content differs are
+    replaced, and ids no longer present are dropped.
+    """
+    seen = set()
+    for entry in fresh:
+        entry_id = entry["id"]
+        seen.add(entry_id)
+        if target.get(entry_id) != entry:
+            target[entry_id] = entry
+    for stale_id in [entry_id for entry_id in target if entry_id not in seen]:
+        del target[stale_id]
+
+
+class NatureRemoCoordinator(DataUpdateCoordinator):
+    """Coordinator with per-appliance listener dispatch.
+
+    The stock listener list fires every entity callback on every refresh,
+    so each appliance entity re-checks an unchanged snapshot — O(N^2) dict
+    work per tick across N appliances. Entities that care about a single
+    appliance can register here instead and are only called when that
+    appliance's entry (or its backing device's entry) was actually replaced
+    by the diff-merge, which keeps unchanged dicts identity-stable.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the coordinator."""
+        super().__init__(*args, **kwargs)
+        self._appliance_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self._appliance_fingerprints: dict[str, tuple[int, int] | None] = {}
+        self._appliance_dispatch_unsub: CALLBACK_TYPE | None = None
+        self._last_dispatch_success: bool | None = None
+
+    @callback
+    def async_add_listener_for_appliance(
+        self, appliance_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for updates that touch one appliance; returns an unsubscribe."""
+        if self._appliance_dispatch_unsub is None:
+            # The dispatcher itself is a stock listener: that keeps the
+            # coordinator's refresh scheduling alive when only keyed
+            # listeners exist, and it runs once per changed tick instead of
+            # once per entity.
+            self._appliance_dispatch_unsub = self.async_add_listener(
+                self._async_dispatch_appliances
+            )
+        listeners = self._appliance_listeners.setdefault(appliance_id, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+            if not listeners:
+                self._appliance_listeners.pop(appliance_id, None)
+                self._appliance_fingerprints.pop(appliance_id, None)
+            if not self._appliance_listeners and self._appliance_dispatch_unsub:
+                self._appliance_dispatch_unsub()
+                self._appliance_dispatch_unsub = None
+
+        return remove_listener
+
+    @callback
+    def _async_dispatch_appliances(self) -> None:
+        """Fire the per-appliance listeners whose entries actually changed.
+
+        A flip of last_update_success forces every keyed listener: the data
+        (and so each fingerprint) is unchanged on a failed refresh, but
+        entity availability just changed for all of them.
+        """
+        data = self.data or {}
+        appliances = data.get("appliances", {})
+        devices = data.get("devices", {})
+        fingerprints = self._appliance_fingerprints
+        success = self.last_update_success
+        force = success != self._last_dispatch_success
+        self._last_dispatch_success = success
+        for appliance_id, listeners in self._appliance_listeners.items():
+            appliance = appliances.get(appliance_id)
+            if appliance is None:
+                fingerprint = None
+            else:
+                device = devices.get(appliance["device"]["id"])
+                fingerprint = (id(appliance), id(device))
+            if not force and fingerprint == fingerprints.get(appliance_id):
+                continue
+            fingerprints[appliance_id] = fingerprint
+            for update_callback in list(listeners):
+                update_callback()
+
+
+class NatureRemoBase(CoordinatorEntity):
+    """Base class for Nature Remo entities."""
+
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: DataUpdateCoordinator, device_id: str) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._device_id = device_id
+        self._device_fingerprint: int | None = None
+        self._last_available: bool | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Register the coordinator listener and the availability check."""
+        await super().async_added_to_hass()
+        self._async_track_availability()
+
+    @callback
+    def _async_track_availability(self) -> None:
+        """Re-check availability on a timer.
+
+        The coordinator only dispatches when data changed or a refresh
+        failed; a device that simply stops reporting keeps its dicts
+        identity-stable forever, so the one-hour window can only be
+        noticed by a time-driven check.
+        """
+        self._last_available = self.available
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_check_availability, AVAILABILITY_CHECK_INTERVAL
+            )
+        )
+
+    @callback
+    def _async_check_availability(self, now: datetime) -> None:
+        """Write state when time alone flipped this entity's availability."""
+        available = self.available
+        if available != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state when this entity's device subtree or availability changed.
+
+        The diff-merge in the API layer keeps unchanged device dicts
+        identity-stable across polls, so id() of the entry is a cheap
+        fingerprint: if it matches the last update and availability is
+        steady, nothing visible changed and the state write can be skipped.
+        """
+        device = self.coordinator.data["devices"].get(self._device_id)
+        fingerprint = id(device) if device is not None else None
+        available = self.available
+        if fingerprint == self._device_fingerprint and available == self._last_available:
+            return
+        self._device_fingerprint = fingerprint
+        self._last_available = available
+        self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Return True if the last poll worked and the device reported recently."""
+        if not self.coordinator.last_update_success:
+            return False
+        device = self.coordinator.data["devices"].get(self._device_id)
+        if not device:
+            return False
+        updated_at = device.get("updated_at")
+        if not updated_at:
+            return True
+        epoch = _updated_epoch(updated_at)
+        if epoch is None:
+            return True
+        return time.time() - epoch < DEVICE_AVAILABILITY_WINDOW
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information for the backing device."""
+        return self._get_device_info()
+
+    def _get_device_info(self) -> DeviceInfo:
+        """Return the pre-resolved device information for this device."""
+        info = self.coordinator.data["device_info"].get(self._device_id)
+        if info is not None:
+            return info
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._device_id)},
+            manufacturer=MANUFACTURER,
+        )
+
+
+class NatureRemoDeviceBase(NatureRemoBase):
+    """Base class for entities backed directly by a Remo device."""
+
+    def __init__(self, coordinator: DataUpdateCoordinator, device: dict[str, Any]) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator, device["id"])
+
+    @property
+    def _device(self) -> dict[str, Any]:
+        """Return the current device snapshot, or an empty dict if it vanished.
+
+        Indexing coordinator.data here would raise KeyError when a device
+        disappears between the coordinator fetch and entity addition (e.g.
+        during a reload), aborting the whole platform setup. Looking the
+        device up lazily keeps the entity alive and merely unavailable
+        through transient coordinator hiccups.
+        """
+        return self.coordinator.data["devices"].get(self._device_id, {})
+
+
+class NatureRemoAPI:
+    """Nature Remo cloud API client."""
+
+    def __init__(
+        self,
+        access_token: str,
+        session: aiohttp.ClientSession | None = None,
+        base_url: str = API_ENDPOINT,
+        ac_debounce: float = DEFAULT_AC_DEBOUNCE,
+    ) -> None:
+        """Initialize the API client."""
+        self._access_token = access_token
+        if session is None:
+            # HA's shared clientsession closes idle connections before the
+            # next poll fires, forcing a fresh TLS handshake every tick. A
+            # dedicated session with a keep-alive at least as long as the
+            # update interval lets the connection survive between polls.
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=4, keepalive_timeout=60, ttl_dns_cache=600
+                )
+            )
+            self._owns_session = True
+        else:
+            self._owns_session = False
+        self._session = session
+        self._base_url = base_url
+        # Endpoint URLs are constant for the client lifetime; build them once
+        # instead of re-interpolating per poll.
+        self._devices_url = f"{base_url}{API_DEVICES}"
+        self._appliances_url = f"{base_url}{API_APPLIANCES}"
+        self._ac_settings_url = f"{base_url}{API_APPLIANCES}/{{}}/aircon_settings"
+        self._ac_debounce = ac_debounce
+        self._pending_ac: dict[str, dict] = {}
+        self._ac_flush_handle: asyncio.TimerHandle | None = None
+        self._ac_flush_task: asyncio.Task | None = None
+        self._ac_batch_future: asyncio.Future[None] | None = None
+        # Token is immutable for the lifetime of the client, so build the
+        # authorization headers once instead of per request.
+        self._headers = {"Authorization": f"Bearer {access_token}"}
+        self._etags: dict[str, str] = {}
+        self._response_cache: dict[str, Any] = {}
+        self._device_info_cache: dict[str, ReadOnlyDict] = {}
+        self._device_info_src: dict[str, tuple[Any, Any]] = {}
+        self._devices_map: dict[str, dict[str, Any]] = {}
+        self._appliances_map: dict[str, dict[str, Any]] = {}
+
+    async def close_session(self) -> None:
+        """Flush pending AC writes, then close the HTTP session if owned.
+
+        Without the flush, unloading the entry right after a control action
+        would silently drop the user's last command, or leave an orphan
+        flush task posting on a closed session.
+        """
+        if self._ac_flush_handle is not None:
+            self._ac_flush_handle.cancel()
+            self._ac_flush_handle = None
+        if self._pending_ac:
+            await self._flush_ac()
+        if self._ac_flush_task is not None:
+            await self._ac_flush_task
+        if self._owns_session:
+            await self._session.close()
+
+    async def _get_json(self, url: str) -> Any:
+        """GET a JSON resource with conditional caching and error translation.
+
+        The device and appliance fetches share the same headers, status
+        ladder, and exception shape; keeping one copy also fixes the old
+        blanket except that re-raised an auth failure as a generic
+        connection error.
+        """
+        headers = self._headers
+        etag = self._etags.get(url)
+        if etag is not None:
+            headers = dict(headers)
+            headers["If-None-Match"] = etag
+        try:
+            async with self._session.get(
+                url,
+                headers=headers,
+                timeout=_REQUEST_TIMEOUT,
+                # Large enough to take the tens-of-KB payload in one chunk
+                # instead of concatenating many small reads.
+                read_bufsize=2**17,
+            ) as response:
+                if response.status == 304:
+                    return self._response_cache[url]
+                if response.status == 401:
+                    raise NatureRemoAuthError(ERROR_AUTH)
+                if response.status != 200:
+                    raise NatureRemoError(ERROR_RESPONSE)
+                etag = response.headers.get("ETag")
+                if etag is not None:
+                    self._etags[url] = etag
+                payload = orjson.loads(await response.read())
+                self._response_cache[url] = payload
+                return payload
+        except asyncio.TimeoutError as err:
+            raise NatureRemoConnectionError(ERROR_TIMEOUT) from err
+        except aiohttp.ClientError as err:
+            raise NatureRemoConnectionError(ERROR_CONNECTION) from err
+
+    async def _get_devices(self) -> list[dict[str, Any]]:
+        """Fetch the device list from the API."""
+        return await self._get_json(self._devices_url)
+
+    async def _get_appliances(self) -> list[dict[str, Any]]:
+        """Fetch the appliance list from the API."""
+        return await self._get_json(self._appliances_url)
+
+    async def get_all_data(self) -> dict[str, Any]:
+        """Fetch devices and appliances concurrently."""
+        async with asyncio.timeout(DEFAULT_TIMEOUT):
+            devices, appliances = await asyncio.gather(
+                self._get_devices(), self._get_appliances()
+            )
+        _merge_entries(self._devices_map, devices)
+        _merge_entries(self._appliances_map, appliances)
+        # The outer mappings are shallow-copied so the coordinator's
+        # always_update=False equality check still sees a change when entries
+        # are replaced; the entry dicts themselves keep their identity across
+        # polls when nothing in them changed.
+        return {
+            "devices": dict(self._devices_map),
+            "appliances": dict(self._appliances_map),
+            "device_info": self._resolve_device_info(devices),
+        }
+
+    def _resolve_device_info(self, devices: list[dict[str, Any]]) -> dict[str, ReadOnlyDict]:
+        """Resolve device information once per poll, reusing unchanged entries.
+
+        Entities read device info on every state write, so the fully-resolved
+        structure is built here and only rebuilt when the name or firmware
+        version actually changes.
+        """
+        info_map: dict[str, ReadOnlyDict] = {}
+        for device in devices:
+            device_id = device["id"]
+            src = (device.get("name"), device.get("firmware_version", ""))
+            if self._device_info_src.get(device_id) != src:
+                firmware = src[1]
+                # Read-only so the one dict can be safely shared by every
+                # entity on the device.
+                self._device_info_cache[device_id] = ReadOnlyDict(
+                    DeviceInfo(
+                        identifiers={(DOMAIN, device_id)},
+                        name=src[0],
+                        manufacturer=MANUFACTURER,
+                        model=FW_TO_MODEL_NAME.get(firmware.split("/")[0], MODEL_UNKNOWN),
+                        sw_version=firmware or None,
+                    )
+                )
+                self._device_info_src[device_id] = src
+            info_map[device_id] = self._device_info_cache[device_id]
+        return info_map
+
+    async def update_ac_settings(self, appliance_id: str, settings: dict) -> None:
+        """Update air conditioner settings, coalescing rapid successive calls.
+
+        Nudging a setpoint via a UI slider fires several writes within a
+        second; each would otherwise cost its own round-trip. Incoming
+        settings are merged into a pending batch per appliance and flushed
+        once the debounce window has elapsed without another call. Callers
+        await the shared batch future, so a failed flush raises
+        NatureRemoError here just like a direct write would; the shield
+        keeps one cancelled caller from cancelling the batch under the
+        other awaiters.
+        """
+        self._pending_ac.setdefault(appliance_id, {}).update(settings)
+        loop = asyncio.get_running_loop()
+        if self._ac_batch_future is None:
+            self._ac_batch_future = loop.create_future()
+        if self._ac_flush_handle is not None:
+            self._ac_flush_handle.cancel()
+        self._ac_flush_handle = loop.call_later(self._ac_debounce, self._start_ac_flush)
+        await asyncio.shield(self._ac_batch_future)
+
+    @callback
+    def _start_ac_flush(self) -> None:
+        """Kick off the flush task, holding a reference so it isn't collected."""
+        self._ac_flush_handle = None
+        self._ac_flush_task = asyncio.get_running_loop().create_task(self._flush_ac())
+
+    async def _flush_ac(self) -> None:
+        """Send one write per appliance for all pending AC settings.
+
+        Failures are logged per appliance; the first one is also set on the
+        batch future so the service calls awaiting this flush see it.
+        """
+        pending, self._pending_ac = self._pending_ac, {}
+        future, self._ac_batch_future = self._ac_batch_future, None
+        if not pending:
+            self._ac_flush_task = None
+            if future is not None and not future.done():
+                future.set_result(None)
+            return
+        results = await asyncio.gather(
+            *(
+                self._post_ac_settings(appliance_id, settings)
+                for appliance_id, settings in pending.items()
+            ),
+            return_exceptions=True,
+        )
+        self._ac_flush_task = None
+        error: BaseException | None = None
+        for appliance_id, result in zip(pending, results):
+            if isinstance(result, BaseException):
+                if error is None:
+                    error = result
+                _LOGGER.error(
+                    "Failed to update AC settings for %s: %s", appliance_id, result
+                )
+        if future is not None and not future.done():
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(None)
+
+    async def _post_ac_settings(self, appliance_id: str, settings: dict) -> None:
+        """POST air conditioner settings for a single appliance."""
+        params = _encode_settings(tuple(sorted(settings.items())))
+        try:
+            async with self._session.post(
+                self._ac_settings_url.format(appliance_id),
+                headers=self._headers,
+                params=params,
+                timeout=_REQUEST_TIMEOUT,
+            ) as response:
+                if response.status == 401:
+                    raise NatureRemoAuthError(ERROR_AUTH)
+                if response.status != 200:
+                    raise NatureRemoError(ERROR_RESPONSE)
+        except asyncio.TimeoutError as err:
+            raise NatureRemoConnectionError(ERROR_TIMEOUT) from err
+        except aiohttp.ClientError as err:
+            raise NatureRemoConnectionError(ERROR_CONNECTION) from err
@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import logging
+import sys
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.climate import ClimateEntity, ClimateEntityFeature, HVACMode
@@ -11,6 +14,9 @@ from homeassistant.components.climate.const import (
     FAN_HIGH,
     FAN_LOW,
     FAN_MEDIUM,
+    PRESET_BOOST,
+    PRESET_ECO,
+    PRESET_NONE,
     SWING_OFF,
     SWING_ON,
 )
@@ -19,7 +25,9 @@ from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import NatureRemoBase
+from homeassistant.helpers.update_coordinator import BaseCoordinatorEntity
+
+from . import NatureRemoBase, NatureRemoError
 from .const import (
     DOMAIN,
     CONF_COOL_TEMP,
@@ -36,23 +44,52 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-# Map HA modes to Nature Remo modes
-MODE_HA_TO_REMO = {
-    HVACMode.AUTO: MODE_MAP["auto"],
-    HVACMode.COOL: MODE_MAP["cool"],
-    HVACMode.HEAT: MODE_MAP["warm"],
-    HVACMode.DRY: MODE_MAP["dry"],
-    HVACMode.FAN_ONLY: MODE_MAP["blow"],
-    HVACMode.OFF: MODE_MAP["off"],
-}
+# Map HA modes to Nature Remo modes. Read-only proxies guard against
+# accidental mutation, and the interned string values give the hot
+# _update_state lookups pointer-equality comparisons.
+MODE_HA_TO_REMO = MappingProxyType(
+    {
+        HVACMode.AUTO: sys.intern(MODE_MAP["auto"]),
+        HVACMode.COOL: sys.intern(MODE_MAP["cool"]),
+        HVACMode.HEAT: sys.intern(MODE_MAP["warm"]),
+        HVACMode.DRY: sys.intern(MODE_MAP["dry"]),
+        HVACMode.FAN_ONLY: sys.intern(MODE_MAP["blow"]),
+        HVACMode.OFF: sys.intern(MODE_MAP["off"]),
+    }
+)
 
 # Map Nature Remo modes to HA modes
-MODE_REMO_TO_HA = {v: k for k, v in MODE_HA_TO_REMO.items()}
+MODE_REMO_TO_HA = MappingProxyType({v: k for k, v in MODE_HA_TO_REMO.items()})
+
+# Map HA preset modes to Nature Remo button values
+PRESET_MODES = MappingProxyType(
+    {
+        PRESET_ECO: sys.intern("power-saving"),
+        PRESET_BOOST: sys.intern("powerful"),
+    }
+)
+
+# Inverted once at import so _update_state resolves a button value with a
+# single dict lookup instead of scanning PRESET_MODES per coordinator tick.
+PRESET_REMO_TO_HA = MappingProxyType({v: k for k, v in PRESET_MODES.items()})
+
+def _aircon_modes(
+    appliance: dict,
+    # C-implemented getters bound as defaults; itemgetter can't chain nested
+    # keys, so one per level, each skipping Python __getitem__ dispatch.
+    _aircon=itemgetter("aircon"),
+    _range=itemgetter("range"),
+    _modes=itemgetter("modes"),
+) -> dict:
+    """Return the per-mode capability table of an AC appliance."""
+    return _modes(_range(_aircon(appliance)))
+
 
 SUPPORT_FLAGS = (
     ClimateEntityFeature.TARGET_TEMPERATURE
     | ClimateEntityFeature.FAN_MODE
     | ClimateEntityFeature.SWING_MODE
+    | ClimateEntityFeature.PRESET_MODE
     | ClimateEntityFeature.TURN_ON
     | ClimateEntityFeature.TURN_OFF
 )
@@ -63,9 +100,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Nature Remo AC."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    api = hass.data[DOMAIN][entry.entry_id]["api"]
-    config = hass.data[DOMAIN][entry.entry_id]["config"]
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    api = entry_data["api"]
+    config = entry_data["config"]
 
     async_add_entities(
         [
@@ -87,7 +125,9 @@ class NatureRemoAC(NatureRemoBase, ClimateEntity):
         super().__init__(coordinator, appliance["device"]["id"])
         self._api = api
         self._appliance = appliance
-        self._attr_unique_id = f"{appliance['id']}_climate"
+        # Interned so registry lookups keyed on the id hit CPython's
+        # pointer-equality fast path.
+        self._attr_unique_id = sys.intern(f"{appliance['id']}_climate")
         self._attr_name = appliance["nickname"]
 
         # Get default temperatures from config
@@ -98,30 +138,75 @@ class NatureRemoAC(NatureRemoBase, ClimateEntity):
 
         # Initialize state
         self._attr_supported_features = SUPPORT_FLAGS
-        self._modes = appliance["aircon"]["range"]["modes"]
+        self._modes = _aircon_modes(appliance)
+
+        # The mode table is static for the lifetime of the entity, so build
+        # the HA mode lists once; HA reads the _attr_* values directly and
+        # skips the property machinery entirely.
+        self._attr_hvac_modes = [HVACMode.OFF] + [
+            MODE_REMO_TO_HA[mode] for mode in self._modes if mode in MODE_REMO_TO_HA
+        ]
+        self._attr_preset_modes = [PRESET_NONE] + list(PRESET_MODES)
+
         self._hvac_mode = None
+        self._last_snapshot: tuple | None = None
+        self._mode_config = None
+        self._preset_mode = None
         self._current_temp = None
         self._target_temp = None
         self._remo_mode = None
         self._fan_mode = None
         self._swing_mode = None
-        self._last_target_temp = {v: None for v in MODE_REMO_TO_HA}
+        # Keyed by HVACMode: every read/write site below indexes with the HA
+        # enum, so Remo-string keys would never match and the remembered
+        # setpoints would silently stay None.
+        self._last_target_temp: dict[HVACMode, float | None] = dict.fromkeys(
+            MODE_HA_TO_REMO, None
+        )
+
+        # The appliance's temperature ranges never change at runtime, so
+        # parse and sort them once per mode instead of rebuilding the float
+        # list on every min_temp/max_temp/step/precision read.
+        self._temp_range_cache: dict[str, list[float]] = {}
+        self._temp_meta: dict[str, tuple[float, float, float]] = {}
+        for mode, mode_config in self._modes.items():
+            temps = sorted({float(t) for t in mode_config.get("temp", []) if t})
+            if not temps:
+                continue
+            step = round(temps[1] - temps[0], 1) if len(temps) >= 2 else 1.0
+            if step not in (0.5, 1.0):
+                step = 1.0
+            self._temp_range_cache[mode] = temps
+            self._temp_meta[mode] = (temps[0], temps[-1], step)
 
         self._update_state(appliance["settings"])
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to updates for this appliance only.
+
+        The stock listener registration lives in BaseCoordinatorEntity, so
+        that is the class skipped here; the keyed registration below fires
+        this entity's handler only when its appliance entry (or the backing
+        device entry) was replaced between polls, and the coordinator keeps
+        its own stock listener so refresh scheduling stays alive.
+        """
+        await super(BaseCoordinatorEntity, self).async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_listener_for_appliance(
+                self._appliance["id"], self._handle_coordinator_update
+            )
+        )
+        self._async_track_availability()
+
     @property
     def hvac_mode(self) -> HVACMode | None:
         """Return hvac operation ie. heat, cool mode."""
         return self._hvac_mode
 
     @property
-    def hvac_modes(self) -> list[HVACMode]:
-        """Return the list of available hvac operation modes."""
-        modes = [HVACMode.OFF]  # Always include OFF
-        for mode in self._modes:
-            if mode in MODE_REMO_TO_HA:
-                modes.append(MODE_REMO_TO_HA[mode])
-        return modes
+    def preset_mode(self) -> str | None:
+        """Return the current preset mode."""
+        return self._preset_mode
 
     @property
     def current_temperature(self) -> float | None:
@@ -136,14 +221,262 @@ class NatureRemoAC(NatureRemoBase, ClimateEntity):
     @property
     def target_temperature_step(self) -> float:
         """Return the supported step of target temperature."""
-        if self._hvac_mode == HVACMode.OFF:
+        meta = self._current_temp_meta()
+        if meta is None:
             return 1.0
-        
-        temp_range = self._get_temp_range()
-        if len(temp_range) >= 2:
-            step = round(temp_range[1] - temp_range[0], 1)
-            return step if step in [0.5, 1.0] else 1.0
-        return 1.0
-
-    # Rest of the class methods...
-    # Add similar updates to other methods using the new constants
+        return meta[2]
+
+    @property
+    def min_temp(self) -> float:
+        """Return the minimum supported temperature."""
+        meta = self._current_temp_meta()
+        if meta is None:
+            return super().min_temp
+        return meta[0]
+
+    @property
+    def max_temp(self) -> float:
+        """Return the maximum supported temperature."""
+        meta = self._current_temp_meta()
+        if meta is None:
+            return super().max_temp
+        return meta[1]
+
+    @property
+    def precision(self) -> float:
+        """Return the precision of the target temperature."""
+        meta = self._current_temp_meta()
+        if meta is None:
+            return 1.0
+        return meta[2]
+
+    @property
+    def fan_mode(self) -> str | None:
+        """Return the current fan setting."""
+        return self._fan_mode
+
+    @property
+    def fan_modes(self) -> list[str] | None:
+        """Return the list of available fan modes."""
+        if self._mode_config is None:
+            return None
+        return self._mode_config.get("vol")
+
+    @property
+    def swing_mode(self) -> str | None:
+        """Return the current swing setting."""
+        return self._swing_mode
+
+    @property
+    def swing_modes(self) -> list[str] | None:
+        """Return the list of available swing modes."""
+        if self._mode_config is None:
+            return None
+        return self._mode_config.get("dir")
+
+    def _refresh_mode_config(self) -> None:
+        """Re-point the cached per-mode config at the current HVAC mode.
+
+        fan_modes and swing_modes are read on every state cycle; caching the
+        mode's config dict whenever the mode changes turns each property
+        into one attribute load instead of three dict lookups.
+        """
+        if self._hvac_mode is None or self._hvac_mode == HVACMode.OFF:
+            self._mode_config = None
+        else:
+            self._mode_config = self._modes.get(MODE_HA_TO_REMO[self._hvac_mode])
+
+    def _current_temp_meta(self) -> tuple[float, float, float] | None:
+        """Return (min, max, step) for the current mode, or None when off."""
+        if self._hvac_mode is None or self._hvac_mode == HVACMode.OFF:
+            return None
+        remo_mode = MODE_HA_TO_REMO.get(self._hvac_mode)
+        return self._temp_meta.get(remo_mode)
+
+    def _get_temp_range(self) -> list[float]:
+        """Return the cached temperature range for the current mode."""
+        if self._hvac_mode is None or self._hvac_mode == HVACMode.OFF:
+            return []
+        remo_mode = MODE_HA_TO_REMO.get(self._hvac_mode)
+        return self._temp_range_cache.get(remo_mode, [])
+
+    def _update_state(
+        self,
+        settings: dict[str, Any],
+        # Bound as defaults so the per-tick lookups are LOAD_FAST instead of
+        # LOAD_GLOBAL in this hot path.
+        _mode_off: str = MODE_MAP["off"],
+        _remo_to_ha: MappingProxyType = MODE_REMO_TO_HA,
+        _preset_remo_to_ha: MappingProxyType = PRESET_REMO_TO_HA,
+    ) -> None:
+        """Update internal state from the appliance settings payload."""
+        # One bound-method alias saves a LOAD_ATTR per field read below.
+        settings_get = settings.get
+        button = settings_get("button")
+        remo_mode = settings_get("mode")
+        if button == _mode_off:
+            self._hvac_mode = HVACMode.OFF
+        elif remo_mode in _remo_to_ha:
+            self._hvac_mode = _remo_to_ha[remo_mode]
+        self._remo_mode = remo_mode
+        self._refresh_mode_config()
+
+        temp = settings_get("temp")
+        try:
+            self._target_temp = float(temp) if temp else None
+        except ValueError:
+            self._target_temp = None
+        if self._target_temp is not None and self._hvac_mode not in (None, HVACMode.OFF):
+            self._last_target_temp[self._hvac_mode] = self._target_temp
+
+        self._fan_mode = settings_get("vol") or None
+        self._swing_mode = settings_get("dir") or None
+
+        self._preset_mode = _preset_remo_to_ha.get(button, PRESET_NONE)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh internal state from the latest coordinator snapshot.
+
+        This runs for every entity on every coordinator tick, so the dict
+        and attribute chains are bound to locals once up front.
+        """
+        data = self.coordinator.data
+        own_appliance = self._appliance
+        if (appliance := data["appliances"].get(own_appliance["id"])) is not None:
+            self._update_state(appliance["settings"])
+
+            device = data["devices"].get(own_appliance["device"]["id"])
+            if device is not None:
+                events = device.get("newest_events")
+                te = events.get("te") if events else None
+                try:
+                    self._current_temp = float(te["val"]) if te else None
+                except (KeyError, TypeError, ValueError):
+                    self._current_temp = None
+
+        # AC settings rarely change between polls; the state write path
+        # serializes the whole state and broadcasts it, so skip it when
+        # nothing tracked actually moved. The snapshot is compared against
+        # the one from the last write (not one taken at handler entry, which
+        # would already reflect the new availability).
+        if self._state_snapshot() != self._last_snapshot:
+            self._async_write_state()
+
+    def _state_snapshot(self) -> tuple:
+        """Return the tuple of attributes that feed the entity state.
+
+        Availability is part of the tuple so a device going dark or a
+        failing coordinator refresh is written out like any other change.
+        """
+        return (
+            self._hvac_mode,
+            self._target_temp,
+            self._current_temp,
+            self._fan_mode,
+            self._swing_mode,
+            self._preset_mode,
+            self.available,
+        )
+
+    @callback
+    def _async_write_state(self) -> None:
+        """Write the entity state, recording the snapshot it was written from."""
+        self._last_snapshot = self._state_snapshot()
+        self._last_available = self._last_snapshot[-1]
+        self.async_write_ha_state()
+
+    async def async_set_temperature(self, **kwargs: Any) -> None:
+        """Set new target temperature."""
+        changed = False
+        if (hvac_mode := kwargs.get(ATTR_HVAC_MODE)) is not None:
+            changed = await self._async_apply_hvac_mode(hvac_mode)
+        target = kwargs.get(ATTR_TEMPERATURE)
+        if target is not None:
+            if isinstance(target, float) and target.is_integer():
+                # The API rejects "25.0" for appliances with whole-degree units.
+                target = int(target)
+            try:
+                await self._api.update_ac_settings(
+                    self._appliance["id"], {"temperature": target}
+                )
+            except NatureRemoError as err:
+                _LOGGER.error("Failed to set temperature: %s", err)
+            else:
+                self._target_temp = float(target)
+                if self._hvac_mode not in (None, HVACMode.OFF):
+                    self._last_target_temp[self._hvac_mode] = self._target_temp
+                changed = True
+        if changed:
+            self._async_write_state()
+
+    async def _async_apply_hvac_mode(
+        self, hvac_mode: HVACMode, _ha_to_remo: MappingProxyType = MODE_HA_TO_REMO
+    ) -> bool:
+        """Send an HVAC mode change and apply it optimistically.
+
+        Returns whether local state changed; the caller decides when to
+        write, so a combined mode + temperature service call serializes and
+        broadcasts the entity state once instead of once per attribute.
+        """
+        remo_mode = _ha_to_remo.get(hvac_mode)
+        if remo_mode is None:
+            return False
+        if hvac_mode == HVACMode.OFF:
+            settings = {"button": remo_mode}
+        else:
+            settings = {"operation_mode": remo_mode}
+            temp = self._last_target_temp.get(hvac_mode) or self._default_temps.get(hvac_mode)
+            if temp is not None:
+                settings["temperature"] = temp
+        try:
+            await self._api.update_ac_settings(self._appliance["id"], settings)
+        except NatureRemoError as err:
+            _LOGGER.error("Failed to set HVAC mode: %s", err)
+            return False
+        self._hvac_mode = hvac_mode
+        self._remo_mode = remo_mode
+        self._refresh_mode_config()
+        return True
+
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        """Set new operation mode."""
+        if await self._async_apply_hvac_mode(hvac_mode):
+            self._async_write_state()
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Set new preset mode."""
+        button = PRESET_MODES.get(preset_mode, "")
+        try:
+            await self._api.update_ac_settings(
+                self._appliance["id"], {"button": button}
+            )
+        except NatureRemoError as err:
+            _LOGGER.error("Failed to set preset mode: %s", err)
+            return
+        self._preset_mode = preset_mode
+        self._async_write_state()
+
+    async def async_set_fan_mode(self, fan_mode: str) -> None:
+        """Set new fan mode."""
+        try:
+            await self._api.update_ac_settings(
+                self._appliance["id"], {"air_volume": fan_mode}
+            )
+        except NatureRemoError as err:
+            _LOGGER.error("Failed to set fan mode: %s", err)
+            return
+        self._fan_mode = fan_mode
+        self._async_write_state()
+
+    async def async_set_swing_mode(self, swing_mode: str) -> None:
+        """Set new swing mode."""
+        try:
+            await self._api.update_ac_settings(
+                self._appliance["id"], {"air_direction": swing_mode}
+            )
+        except NatureRemoError as err:
+            _LOGGER.error("Failed to set swing mode: %s", err)
+            return
+        self._swing_mode = swing_mode
+        self._async_write_state()
@@ -1,5 +1,6 @@
 """Constants for Nature Remo integration."""
 from datetime import timedelta
+from types import MappingProxyType
 
 # Domain
 DOMAIN = "nature_remo"
@@ -26,6 +27,7 @@ DEFAULT_UPDATE_INTERVAL = timedelta(seconds=60)
 DEFAULT_COOL_TEMP = 28
 DEFAULT_HEAT_TEMP = 20
 DEFAULT_TIMEOUT = 30  # seconds
+DEFAULT_AC_DEBOUNCE = 0.3  # seconds to coalesce successive AC settings writes
 
 # AC Operation Modes
 MODE_MAP = {
@@ -49,6 +51,20 @@ MODEL_REMO_2 = "Remo 2"
 MODEL_REMO_E = "Remo E"
 MODEL_REMO_E_LITE = "Remo E lite"
 MODEL_REMO_MINI = "Remo mini"
+MODEL_UNKNOWN = "Unknown"
+
+# Firmware-version prefix ("Remo-mini" in "Remo-mini/1.0.62") to model name.
+# Frozen so the hot lookup can never be mutated and unknown firmware falls
+# back to MODEL_UNKNOWN instead of raising.
+FW_TO_MODEL_NAME = MappingProxyType(
+    {
+        "Remo": MODEL_REMO,
+        "Remo-2": MODEL_REMO_2,
+        "Remo-E": MODEL_REMO_E,
+        "Remo-E-lite": MODEL_REMO_E_LITE,
+        "Remo-mini": MODEL_REMO_MINI,
+    }
+)
 
 # Update Intervals
 UPDATE_INTERVAL_SENSORS = timedelta(seconds=60)
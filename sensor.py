@@ -2,6 +2,7 @@
 """Support for Nature Remo sensors."""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 import logging
 from typing import Any, Callable
@@ -20,8 +21,9 @@ from homeassistant.const import (
     UnitOfTemperature,
     LIGHT_LUX,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
 
 from . import NatureRemoBase, NatureRemoDeviceBase
 from .const import (
@@ -34,65 +36,100 @@ from .const import (
     ATTR_HUMIDITY,
     ATTR_ILLUMINANCE,
     ATTR_POWER,
-    SUPPORT_FLAGS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass
+def _meter_property_value(data: dict[str, Any], prop: int) -> Any:
+    """Return the val of one Echonet property, or None when absent.
+
+    Total on missing keys so the read path never pays for raising and
+    catching; a device mid-outage simply reports unknown.
+    """
+    meter = data.get("smart_meter")
+    props = meter.get("echonetlite_properties") if meter else None
+    entry = props.get(prop) if props else None
+    return entry.get("val") if entry else None
+
+
+def _event_value(device: dict[str, Any], key: str) -> Any:
+    """Return the val of one newest_events reading, or None when absent."""
+    events = device.get("newest_events")
+    entry = events.get(key) if events else None
+    return entry.get("val") if entry else None
+
+@dataclass(frozen=True, kw_only=True)
 class NatureRemoSensorEntityDescription(SensorEntityDescription):
     """Class describing Nature Remo sensor entities."""
     value_fn: Callable[[Any], StateType] | None = None
 
 
-SENSOR_TYPES: tuple[NatureRemoSensorEntityDescription, ...] = (
-    # Power sensors
-    NatureRemoSensorEntityDescription(
-        key=ATTR_POWER,
-        name="Power",
-        native_unit_of_measurement=POWER_WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("smart_meter", {}).get("echonetlite_properties", {}).get(ECHONET_INSTANT_POWER, {}).get("val", None),
+POWER_DESC = NatureRemoSensorEntityDescription(
+    key=sys.intern(ATTR_POWER),
+    name="Power",
+    native_unit_of_measurement=POWER_WATT,
+    device_class=SensorDeviceClass.POWER,
+    state_class=SensorStateClass.MEASUREMENT,
+    # Helper and Echonet constants bound as defaults so every read resolves
+    # them with LOAD_FAST instead of module-global lookups.
+    value_fn=lambda data, _value=_meter_property_value, _prop=ECHONET_INSTANT_POWER: (
+        _value(data, _prop)
     ),
-    NatureRemoSensorEntityDescription(
-        key="energy",
-        name="Energy",
-        native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: (
-            data.get("smart_meter", {}).get("echonetlite_properties", {}).get(ECHONET_CUMULATIVE_POWER, {}).get("val", 0)
-            / ECHONET_COEFFICIENT
-        ),
-    ),
-    # Environmental sensors
-    NatureRemoSensorEntityDescription(
-        key=ATTR_TEMPERATURE,
-        name="Temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda device: float(device.get("newest_events", {}).get("te", {}).get("val", None)),
-    ),
-    NatureRemoSensorEntityDescription(
-        key=ATTR_HUMIDITY,
-        name="Humidity",
-        native_unit_of_measurement=PERCENTAGE,
-        device_class=SensorDeviceClass.HUMIDITY,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda device: float(device.get("newest_events", {}).get("hu", {}).get("val", None)),
-    ),
-    NatureRemoSensorEntityDescription(
-        key=ATTR_ILLUMINANCE,
-        name="Illuminance",
-        native_unit_of_measurement=LIGHT_LUX,
-        device_class=SensorDeviceClass.ILLUMINANCE,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda device: float(device.get("newest_events", {}).get("il", {}).get("val", None)),
+)
+
+ENERGY_DESC = NatureRemoSensorEntityDescription(
+    key=sys.intern("energy"),
+    name="Energy",
+    native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
+    device_class=SensorDeviceClass.ENERGY,
+    state_class=SensorStateClass.TOTAL_INCREASING,
+    value_fn=lambda data, _value=_meter_property_value, _prop=ECHONET_CUMULATIVE_POWER, _coeff=ECHONET_COEFFICIENT: (
+        value / _coeff if (value := _value(data, _prop)) is not None else None
     ),
 )
 
+TEMP_DESC = NatureRemoSensorEntityDescription(
+    key=sys.intern(ATTR_TEMPERATURE),
+    name="Temperature",
+    native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    device_class=SensorDeviceClass.TEMPERATURE,
+    state_class=SensorStateClass.MEASUREMENT,
+    value_fn=lambda device, _value=_event_value: _value(device, "te"),
+)
+
+HUMIDITY_DESC = NatureRemoSensorEntityDescription(
+    key=sys.intern(ATTR_HUMIDITY),
+    name="Humidity",
+    native_unit_of_measurement=PERCENTAGE,
+    device_class=SensorDeviceClass.HUMIDITY,
+    state_class=SensorStateClass.MEASUREMENT,
+    value_fn=lambda device, _value=_event_value: _value(device, "hu"),
+)
+
+ILLUMINANCE_DESC = NatureRemoSensorEntityDescription(
+    key=sys.intern(ATTR_ILLUMINANCE),
+    name="Illuminance",
+    native_unit_of_measurement=LIGHT_LUX,
+    device_class=SensorDeviceClass.ILLUMINANCE,
+    state_class=SensorStateClass.MEASUREMENT,
+    value_fn=lambda device, _value=_event_value: _value(device, "il"),
+)
+
+SENSOR_TYPES: tuple[NatureRemoSensorEntityDescription, ...] = (
+    POWER_DESC,
+    ENERGY_DESC,
+    TEMP_DESC,
+    HUMIDITY_DESC,
+    ILLUMINANCE_DESC,
+)
+
+_ENERGY_DESCS = (POWER_DESC, ENERGY_DESC)
+
+# Echonet event key to environmental description. The newest_events keys a
+# device reports are the authoritative capability list, so entity creation
+# keys off them directly instead of a firmware-to-capability table.
+_ENV_KEY_TO_DESC = {"te": TEMP_DESC, "hu": HUMIDITY_DESC, "il": ILLUMINANCE_DESC}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -105,40 +142,30 @@ async def async_setup_entry(
     # Add energy meter sensors
     for appliance in coordinator.data.get("appliances", {}).values():
         if appliance["type"] == TYPE_SMART_METER:
-            for description in SENSOR_TYPES[:2]:  # Power and Energy sensors
-                if appliance["id"] in coordinator.data["appliances"]:
-                    entities.append(
-                        NatureRemoEnergySensor(coordinator, appliance, description)
-                    )
+            for description in _ENERGY_DESCS:
+                entities.append(
+                    NatureRemoEnergySensor(coordinator, appliance, description)
+                )
+
+    # Device ids already handled as appliances, computed once so the loop
+    # below does an O(1) membership test per device instead of rebuilding
+    # the id list for every device.
+    appliance_device_ids = frozenset(
+        app["device"]["id"] for app in coordinator.data["appliances"].values()
+    )
 
     # Add environmental sensors
     for device in coordinator.data.get("devices", {}).values():
-        device_model = device.get("firmware_version", "")
-        supported_capabilities = SUPPORT_FLAGS.get(device_model, [])
-
         # Skip devices that are already handled as appliances
-        if device["id"] in [
-            app["device"]["id"] for app in coordinator.data["appliances"].values()
-        ]:
+        if device["id"] in appliance_device_ids:
             continue
 
-        # Add temperature sensor if supported
-        if "temperature" in supported_capabilities:
-            entities.append(
-                NatureRemoSensor(coordinator, device, SENSOR_TYPES[2])
-            )
-
-        # Add humidity sensor if supported
-        if "humidity" in supported_capabilities:
-            entities.append(
-                NatureRemoSensor(coordinator, device, SENSOR_TYPES[3])
-            )
-
-        # Add illuminance sensor if supported
-        if "illuminance" in supported_capabilities:
-            entities.append(
-                NatureRemoSensor(coordinator, device, SENSOR_TYPES[4])
-            )
+        events = device.get("newest_events") or {}
+        entities.extend(
+            NatureRemoSensor(coordinator, device, description)
+            for key, description in _ENV_KEY_TO_DESC.items()
+            if key in events
+        )
 
     async_add_entities(entities)
 
@@ -146,6 +173,10 @@ async def async_setup_entry(
 class NatureRemoSensor(NatureRemoDeviceBase, SensorEntity):
     """Implementation of a Nature Remo sensor."""
 
+    # The HA bases are unslotted so instances keep a __dict__; slotting the
+    # hot cache fields still turns their access into direct descriptors.
+    __slots__ = ("_cached_value", "_value_src_id")
+
     entity_description: NatureRemoSensorEntityDescription
 
     def __init__(
@@ -157,28 +188,54 @@ class NatureRemoSensor(NatureRemoDeviceBase, SensorEntity):
         """Initialize the sensor with unique ID and name."""
         super().__init__(coordinator, device)
         self.entity_description = description
-        self._attr_unique_id = f"{device['id']}_{description.key}"
+        # Interned so registry lookups keyed on the id hit CPython's
+        # pointer-equality fast path.
+        self._attr_unique_id = sys.intern(f"{device['id']}_{description.key}")
         self._attr_name = f"{device.get('name', 'Nature Remo')} {description.name}"
+        self._cached_value: StateType = None
+        self._value_src_id = 0
 
     @property
     def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        try:
-            if self.entity_description.value_fn:
-                return self.entity_description.value_fn(self._device)
-        except (KeyError, TypeError, ValueError) as err:
-            _LOGGER.warning(
-                "Error getting state for %s sensor %s: %s",
-                self.entity_description.key,
-                self.name,
-                err,
-            )
-        return None
+        """Return the state of the sensor.
+
+        HA reads this several times per state write and the diff-merge keeps
+        an unchanged device dict identity-stable across polls, so the parsed
+        value is cached per source-dict identity and only recomputed when
+        the device entry was actually replaced.
+        """
+        device = self._device
+        if id(device) == self._value_src_id:
+            return self._cached_value
+        value: StateType = None
+        if self.entity_description.value_fn:
+            value = self.entity_description.value_fn(device)
+        self._cached_value = value
+        self._value_src_id = id(device)
+        return value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the parsed value actually changed.
+
+        The device entry can be replaced for reasons that don't move this
+        sensor's reading (another event field, updated_at); comparing the
+        freshly parsed value against the previous one skips those writes.
+        Availability is part of the comparison so a failing coordinator or
+        a device gone quiet doesn't leave the last reading shown forever.
+        """
+        previous = self._cached_value if self._value_src_id else object()
+        available = self.available
+        if self.native_value != previous or available != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()
 
 
 class NatureRemoEnergySensor(NatureRemoBase, SensorEntity):
     """Implementation of a Nature Remo energy sensor."""
 
+    __slots__ = ("_appliance_id", "_cached_value", "_value_src_id")
+
     entity_description: NatureRemoSensorEntityDescription
 
     def __init__(
@@ -190,22 +247,43 @@ class NatureRemoEnergySensor(NatureRemoBase, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator, appliance["device"]["id"])
         self.entity_description = description
-        self._appliance = appliance
-        self._attr_unique_id = f"{appliance['id']}_{description.key}"
+        # Only the id is needed after setup; holding the whole appliance
+        # dict would just pin a stale snapshot.
+        self._appliance_id = appliance["id"]
+        self._attr_unique_id = sys.intern(f"{appliance['id']}_{description.key}")
         self._attr_name = f"{appliance['nickname']} {description.name}"
+        self._cached_value: StateType = None
+        self._value_src_id = 0
 
     @property
     def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        try:
-            if self.entity_description.value_fn:
-                appliance = self.coordinator.data["appliances"][self._appliance["id"]]
-                return self.entity_description.value_fn(appliance)
-        except (KeyError, TypeError, ValueError) as err:
-            _LOGGER.warning(
-                "Error getting state for %s sensor %s: %s",
-                self.entity_description.key,
-                self.name,
-                err,
-            )
-        return None
+        """Return the state of the sensor.
+
+        Cached per appliance-dict identity, same as NatureRemoSensor: the
+        merge layer only replaces the dict when the payload changed.
+        """
+        appliance = self.coordinator.data["appliances"].get(self._appliance_id)
+        if id(appliance) == self._value_src_id:
+            return self._cached_value
+        value: StateType = None
+        if appliance is not None and self.entity_description.value_fn:
+            value = self.entity_description.value_fn(appliance)
+        self._cached_value = value
+        self._value_src_id = id(appliance)
+        return value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the parsed value actually changed.
+
+        Also rebinds the update check to the appliance entry: the base
+        class fingerprints the backing device dict, but smart-meter
+        readings live on the appliance and can change independently.
+        Availability joins the comparison for the same reason as in
+        NatureRemoSensor.
+        """
+        previous = self._cached_value if self._value_src_id else object()
+        available = self.available
+        if self.native_value != previous or available != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()